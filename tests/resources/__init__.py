@@ -14,3 +14,5 @@ CONFIG_DATA = config.read_config(config_path=CONFIG_FILE.as_posix())
 
 CACHE_FILE = RESOURCES / ".pyodk_cache.toml"
 CACHE_DATA = config.read_cache_token(cache_path=CACHE_FILE.as_posix())
+
+FORM_ATTACHMENT_FRUITS = (RESOURCES / "forms" / "fruits.csv").as_posix()
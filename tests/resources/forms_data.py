@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 
 test_forms = {
@@ -76,13 +77,18 @@ test_forms = {
 }
 
 
+@cache
+def _read_xml__range_draft() -> str:
+    with open(Path(__file__).parent / "forms" / "range_draft.xml") as fd:
+        return fd.read()
+
+
 def get_xml__range_draft(
     form_id: str | None = "range_draft", version: str | None = None
 ) -> str:
     if version is None:
         version = datetime.now(UTC).isoformat()
-    with open(Path(__file__).parent / "forms" / "range_draft.xml") as fd:
-        return fd.read().format(form_id=form_id, version=version)
+    return _read_xml__range_draft().format(form_id=form_id, version=version)
 
 
 def get_md__pull_data(version: str | None = None) -> str:
@@ -1,9 +1,11 @@
+from collections import Counter
 from datetime import datetime
 from unittest import TestCase, skip
 
+from pyodk._endpoints.entity_lists import EntityList
 from pyodk.client import Client
 
-from tests.resources import RESOURCES, forms_data, submissions_data
+from tests.resources import FORM_ATTACHMENT_FRUITS, forms_data, submissions_data
 from tests.utils import utils
 from tests.utils.entity_lists import create_new_or_get_entity_list
 from tests.utils.forms import (
@@ -11,7 +13,7 @@ from tests.utils.forms import (
     create_new_form__xml,
     get_latest_form_version,
 )
-from tests.utils.md_table import md_table_to_bytes, md_table_to_temp_dir
+from tests.utils.md_table import md_table_to_bytes
 from tests.utils.submissions import (
     create_new_or_get_last_submission,
     create_or_update_submission_with_comment,
@@ -39,7 +41,7 @@ def create_test_forms(client: Client | None = None) -> Client:
     )
     create_new_form__md(
         client=client,
-        form_id="non_ascii_form_id",
+        form_id="'=+/*-451%/%",
         form_def=forms_data.md__symbols,
     )
     create_new_form__md(
@@ -88,6 +90,36 @@ def create_test_entity_lists(client: Client | None = None) -> Client:
     return client
 
 
+def create_test_entities(
+    client: Client, entity_props: list[str], data: list[dict]
+) -> EntityList:
+    """
+    Create a new test entity list, and add the entities with a single request.
+
+    :param client: Client instance to use for API calls.
+    :param entity_props: Properties to add to the entity list.
+    :param data: The entities to create, as passed to `entities.create_many()`.
+    :return: The new entity list.
+    """
+    entity_list = client.entity_lists.create(
+        entity_list_name=client.session.get_xform_uuid()
+    )
+    for prop in entity_props:
+        client.entity_lists.add_property(name=prop, entity_list_name=entity_list.name)
+    client.entities.create_many(data=data, entity_list_name=entity_list.name)
+    return entity_list
+
+
+def rows_to_counter(rows: list[dict], keys: tuple[str, ...]) -> Counter:
+    """
+    Count the rows by their values for the keys, to compare rows regardless of order.
+
+    :param rows: The rows to count.
+    :param keys: The keys to read from each row. Missing keys are counted as None.
+    """
+    return Counter(frozenset((k, r.get(k)) for k in keys) for r in rows)
+
+
 @skip
 class TestUsage(TestCase):
     """Tests for experimenting with usage scenarios / general debugging / integration."""
@@ -101,6 +133,10 @@ class TestUsage(TestCase):
         create_test_submissions(client=cls.client)
         create_test_entity_lists(client=cls.client)
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+
     def test_direct(self):
         projects = self.client.projects.list()
         forms = self.client.forms.list()
@@ -116,13 +152,19 @@ class TestUsage(TestCase):
             form_id="pull_data",
             instance_id=next(s.instanceId for s in submissions),
         )
-        print([projects, forms, submissions, form_data, form_data_params, comments])
+        self.assertGreater(len(projects), 0)
+        self.assertGreater(len(forms), 0)
+        self.assertGreater(len(submissions), 0)
+        self.assertGreater(len(form_data["value"]), 0)
+        self.assertEqual(len(form_data_params["value"]), form_data_params["@odata.count"])
+        self.assertIsInstance(comments, list)
 
     def test_direct_context(self):
         with Client() as client:
             projects = client.projects.list()
             forms = client.forms.list()
-        print(projects, forms)
+        self.assertGreater(len(projects), 0)
+        self.assertGreater(len(forms), 0)
 
     def test_form_create__new_definition_xml(self):
         """Should create a new form with the new definition."""
@@ -145,7 +187,7 @@ class TestUsage(TestCase):
         wb = md_table_to_bytes(mdstr=form_def)
         form = self.client.forms.create(
             definition=wb,
-            attachments=[(RESOURCES / "forms" / "fruits.csv").as_posix()],
+            attachments=[FORM_ATTACHMENT_FRUITS],
         )
         self.assertTrue(form.xmlFormId.startswith("uuid:"))
 
@@ -162,48 +204,43 @@ class TestUsage(TestCase):
     def test_form_update__new_definition_and_attachments(self):
         """Should create a new version with new definition and attachment."""
         # To test the API without a version_updater, a timestamped version is created.
-        with md_table_to_temp_dir(
-            form_id="pull_data", mdstr=forms_data.get_md__pull_data()
-        ) as fp:
-            self.client.forms.update(
-                form_id="pull_data",
-                definition=fp.as_posix(),
-                attachments=[(RESOURCES / "forms" / "fruits.csv").as_posix()],
-            )
+        self.client.forms.update(
+            form_id="pull_data",
+            definition=md_table_to_bytes(mdstr=forms_data.get_md__pull_data()),
+            attachments=[FORM_ATTACHMENT_FRUITS],
+        )
 
     def test_form_update__new_definition_and_attachments__non_ascii_dingbat(self):
         """Should create a new version with new definition and attachment."""
-        with md_table_to_temp_dir(
-            form_id="✅", mdstr=forms_data.get_md__pull_data()
-        ) as fp:
-            self.client.forms.update(
-                form_id="✅",
-                definition=fp.as_posix(),
-                attachments=[(RESOURCES / "forms" / "fruits.csv").as_posix()],
-            )
-            form = self.client.forms.get("✅")
-            self.assertEqual(form.xmlFormId, "✅")
+        self.client.forms.update(
+            form_id="✅",
+            definition=md_table_to_bytes(mdstr=forms_data.get_md__pull_data()),
+            attachments=[FORM_ATTACHMENT_FRUITS],
+        )
+        form = self.client.forms.get("✅")
+        self.assertEqual(form.xmlFormId, "✅")
 
     def test_form_update__with_version_updater__non_ascii_specials(self):
         """Should create a new version with new definition."""
+        now = datetime.now().isoformat()
         self.client.forms.update(
             form_id="'=+/*-451%/%",
             attachments=[],
-            version_updater=lambda v: datetime.now().isoformat(),
+            version_updater=lambda v: now,
         )
 
     def test_form_update__attachments(self):
         """Should create a new version with new attachment."""
         self.client.forms.update(
             form_id="pull_data",
-            attachments=[(RESOURCES / "forms" / "fruits.csv").as_posix()],
+            attachments=[FORM_ATTACHMENT_FRUITS],
         )
 
     def test_form_update__attachments__with_version_updater(self):
         """Should create a new version with new attachment and updated version."""
         self.client.forms.update(
             form_id="pull_data",
-            attachments=[(RESOURCES / "forms" / "fruits.csv").as_posix()],
+            attachments=[FORM_ATTACHMENT_FRUITS],
             version_updater=lambda v: v + "_1",
         )
 
@@ -223,7 +260,7 @@ class TestUsage(TestCase):
         form_id = "'=+/*-451%/%"
         iid = f"""scna+~!@#$%^&*()_+=-✅✅+{datetime.now().isoformat()}"""
 
-        self.client.submissions.create(
+        created = self.client.submissions.create(
             xml=submissions_data.get_xml__fruits(
                 form_id=form_id,
                 version=get_latest_form_version(client=self.client, form_id=form_id),
@@ -231,6 +268,8 @@ class TestUsage(TestCase):
             ),
             form_id=form_id,
         )
+        self.assertEqual(iid, created.instanceId)
+        # Check the instance_id can be quoted into a URL path and resolved by Central.
         submission = self.client.submissions.get(form_id=form_id, instance_id=iid)
         self.assertEqual(iid, submission.instanceId)
 
@@ -242,16 +281,18 @@ class TestUsage(TestCase):
         iid = """sena_~~!@#$%^&*()_+=-✅✅"""
 
         # So we have a submission to edit, create one or find the most recent prior edit.
+        version = get_latest_form_version(client=self.client, form_id=form_id)
         old_iid = create_new_or_get_last_submission(
             client=self.client,
             form_id=form_id,
             instance_id=iid,
+            version=version,
         )
         now = datetime.now().isoformat()
         self.client.submissions.edit(
             xml=submissions_data.get_xml__fruits(
                 form_id=form_id,
-                version=get_latest_form_version(client=self.client, form_id=form_id),
+                version=version,
                 instance_id=iid + now,
                 deprecated_instance_id=old_iid,
             ),
@@ -313,19 +354,13 @@ class TestUsage(TestCase):
 
     def test_entity__merge__existing__add_props__delete_unmatched(self):
         """Should create a new Entity List, and merge in some new data."""
-        self.client.entity_lists.default_entity_list_name = (
-            self.client.session.get_xform_uuid()
-        )
-        entity_list = self.client.entity_lists.create()
-        self.client.entity_lists.add_property(
-            name="state", entity_list_name=entity_list.name
-        )
-        self.client.entities.create_many(
+        entity_list = create_test_entities(
+            client=self.client,
+            entity_props=["state"],
             data=[
                 {"label": "Sydney", "state": "VIC"},
                 {"label": "Darwin", "state": "NT"},
             ],
-            entity_list_name=entity_list.name,
         )
         # Add postcode property, Add Brisbane, update Sydney, delete Darwin.
         self.client.entities.merge(
@@ -342,32 +377,21 @@ class TestUsage(TestCase):
             {"label": "Sydney", "state": "NSW", "postcode": "2001"},
             {"label": "Brisbane", "state": "QLD", "postcode": "4000"},
         ]
-        observed = [
-            {k: o.get(k) for k in ("state", "label", "postcode")}
-            for o in entity_data["value"]
-        ]
-        self.assertTrue(
-            len(expected) == len(observed)
-            and all(e in observed for e in expected)
-            and expected[0].keys() == observed[0].keys(),
-            observed,
+        keys = ("state", "label", "postcode")
+        self.assertEqual(
+            rows_to_counter(rows=expected, keys=keys),
+            rows_to_counter(rows=entity_data["value"], keys=keys),
         )
 
     def test_entity__merge__existing__ignore_props__keep_unmatched(self):
         """Should create a new Entity List, and merge in some new data."""
-        self.client.entity_lists.default_entity_list_name = (
-            self.client.session.get_xform_uuid()
-        )
-        entity_list = self.client.entity_lists.create()
-        self.client.entity_lists.add_property(
-            name="state", entity_list_name=entity_list.name
-        )
-        self.client.entities.create_many(
+        entity_list = create_test_entities(
+            client=self.client,
+            entity_props=["state"],
             data=[
                 {"label": "Sydney", "state": "VIC"},
                 {"label": "Darwin", "state": "NT"},
             ],
-            entity_list_name=entity_list.name,
         )
         # Skip postcode property, add Brisbane, update Sydney, keep Darwin.
         self.client.entities.merge(
@@ -385,14 +409,10 @@ class TestUsage(TestCase):
             {"label": "Brisbane", "state": "QLD"},
             {"label": "Darwin", "state": "NT"},
         ]
-        observed = [
-            {k: o.get(k) for k in ("state", "label")} for o in entity_data["value"]
-        ]
-        self.assertTrue(
-            len(expected) == len(observed)
-            and all(e in observed for e in expected)
-            and expected[0].keys() == observed[0].keys(),
-            observed,
+        keys = ("state", "label")
+        self.assertEqual(
+            rows_to_counter(rows=expected, keys=keys),
+            rows_to_counter(rows=entity_data["value"], keys=keys),
         )
 
     def test_entity_lists__list(self):
@@ -8,19 +8,19 @@ from pyodk.errors import PyODKError
 from tests import resources
 from tests.utils.utils import get_temp_dir
 
+SECTION_DATA = {
+    "base_url": "https://www.example.com",
+    "username": "user",
+    "password": "pass",
+}
+CONFIG_FILE_ENV = {"PYODK_CONFIG_FILE": resources.CONFIG_FILE.as_posix()}
+CACHE_FILE_ENV = {"PYODK_CACHE_FILE": resources.CACHE_FILE.as_posix()}
 
-class TestConfig(TestCase):
-    def setUp(self) -> None:
-        self.section_data = {
-            "base_url": "https://www.example.com",
-            "username": "user",
-            "password": "pass",
-        }
 
+class TestConfig(TestCase):
     def test_read_config__ok(self):
         """Should return the configuration data when no path is specified."""
-        cf = {"PYODK_CONFIG_FILE": resources.CONFIG_FILE.as_posix()}
-        with patch.dict(os.environ, cf, clear=True):
+        with patch.dict(os.environ, CONFIG_FILE_ENV, clear=True):
             self.assertIsInstance(config.read_config(), config.Config)
 
     def test_read_config__ok__with_path(self):
@@ -31,8 +31,7 @@ class TestConfig(TestCase):
 
     def test_read_cache__ok(self):
         """Should return the cache data when no path is specified."""
-        cf = {"PYODK_CACHE_FILE": resources.CACHE_FILE.as_posix()}
-        with patch.dict(os.environ, cf, clear=True):
+        with patch.dict(os.environ, CACHE_FILE_ENV, clear=True):
             self.assertIsInstance(config.read_cache_token(), str)
 
     def test_read_cache__ok__with_path(self):
@@ -74,8 +73,7 @@ class TestConfig(TestCase):
         self.assertEqual("central", err.exception.args[0])
 
     def test_objectify_config__error__missing_key(self):
-        del self.section_data["password"]
-        cfg = {"central": self.section_data}
+        cfg = {"central": {k: v for k, v in SECTION_DATA.items() if k != "password"}}
         with self.assertRaises(TypeError) as err:
             config.objectify_config(config_data=cfg)
         # Py3.8 doesn't prefix the class name to __init__(), but Py3.10 does.
@@ -85,8 +83,7 @@ class TestConfig(TestCase):
         )
 
     def test_objectify_config__error__empty_key(self):
-        self.section_data["password"] = ""
-        cfg = {"central": self.section_data}
+        cfg = {"central": {**SECTION_DATA, "password": ""}}
         with self.assertRaises(PyODKError) as err:
             config.objectify_config(config_data=cfg)
         self.assertEqual(
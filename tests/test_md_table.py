@@ -0,0 +1,25 @@
+from unittest import TestCase
+
+from tests.utils.md_table import md_table_to_ss_structure
+
+
+class TestMdTable(TestCase):
+    def test_md_table_to_ss_structure__line_break_chars_in_cell(self):
+        """Should only split rows on newline, keeping other line break chars in cells."""
+        for char in ("\u2028", "\x85", "\r", "\x0c"):
+            with self.subTest(msg=repr(char)):
+                md = f"""
+                | survey |      |      |                |
+                |        | type | name | label          |
+                |        | text | q1   | Line{char}sep |
+                """
+                observed = md_table_to_ss_structure(mdstr=md)
+                self.assertEqual(
+                    [
+                        (
+                            "survey",
+                            [("type", "name", "label"), ("text", "q1", f"Line{char}sep")],
+                        )
+                    ],
+                    observed,
+                )
@@ -11,24 +11,16 @@ def create_new_or_get_entity_list(
 
     :param client: Client instance to use for API calls.
     :param entity_list_name: Name of the entity list.
-    :param entity_props: Properties to add to the entity list.
+    :param entity_props: Properties to add to the entity list, if not already present.
     """
     try:
-        entity_list = client.entity_lists.create(entity_list_name=entity_list_name)
+        entity_list = client.entity_lists.get(entity_list_name=entity_list_name)
     except PyODKError as err:
-        if not err.is_central_error(code=409.3):
+        if not err.is_central_error(code=404.1):
             raise
-        entity_list = client.session.get(
-            url=client.session.urlformat(
-                "projects/{pid}/datasets/{eln}",
-                pid=client.project_id,
-                eln=entity_list_name,
-            ),
-        )
+        entity_list = client.entity_lists.create(entity_list_name=entity_list_name)
+    existing_props = {p.name for p in entity_list.properties or []}
     for prop in entity_props:
-        try:
+        if prop not in existing_props:
             client.entity_lists.add_property(name=prop, entity_list_name=entity_list_name)
-        except PyODKError as err:
-            if not err.is_central_error(code=409.3):
-                raise
-    return EntityList(**entity_list.json())
+    return entity_list
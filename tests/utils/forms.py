@@ -4,15 +4,28 @@ from pyodk.client import Client
 from pyodk.errors import PyODKError
 
 from tests.utils import utils
-from tests.utils.md_table import md_table_to_temp_dir
+from tests.utils.md_table import md_table_to_bytes
 
 
-def create_ignore_duplicate_error(
+def create_if_not_exists(
     client: Client,
     definition: PathLike | str | bytes,
     form_id: str,
 ):
-    """Create the form; ignore the error raised if it exists (409.3)."""
+    """
+    Create the form, unless a form with this form_id already exists.
+
+    The form_id is only a fallback if the definition specifies its own form_id, so pass
+    that form_id for the existence check to find the form. The error raised if the
+    form exists (409.3) is also ignored.
+    """
+    try:
+        client.forms.get(form_id=form_id)
+    except PyODKError as err:
+        if not err.is_central_error(code=404.1):
+            raise
+    else:
+        return
     try:
         client.forms.create(definition=definition, form_id=form_id)
     except PyODKError as err:
@@ -28,10 +41,9 @@ def create_new_form__md(client: Client, form_id: str, form_def: str):
     :param form_id: The xmlFormId of the Form being referenced.
     :param form_def: The form definition MarkDown.
     """
-    with (
-        md_table_to_temp_dir(form_id=form_id, mdstr=form_def) as fp,
-    ):
-        create_ignore_duplicate_error(client=client, definition=fp, form_id=form_id)
+    create_if_not_exists(
+        client=client, definition=md_table_to_bytes(mdstr=form_def), form_id=form_id
+    )
 
 
 def create_new_form__xml(client: Client, form_id: str, form_def: str):
@@ -44,7 +56,7 @@ def create_new_form__xml(client: Client, form_id: str, form_def: str):
     """
     with utils.get_temp_file(suffix=".xml") as fp:
         fp.write_text(form_def)
-        create_ignore_duplicate_error(client=client, definition=fp, form_id=form_id)
+        create_if_not_exists(client=client, definition=fp, form_id=form_id)
 
 
 def get_latest_form_version(client: Client, form_id: str) -> str:
@@ -61,6 +73,4 @@ def get_latest_form_version(client: Client, form_id: str) -> str:
             fid=form_id,
         )
     )
-    return sorted(
-        (s for s in versions.json()), key=lambda s: s["publishedAt"], reverse=True
-    )[0]["version"]
+    return max(versions.json(), key=lambda s: s["publishedAt"])["version"]
@@ -3,95 +3,68 @@ Markdown table utility functions.
 """
 
 import re
-from contextlib import contextmanager
+from collections.abc import Iterator
 from io import BytesIO
-from pathlib import Path
 
 from openpyxl import Workbook
 from xlwt import Workbook as XLSWorkbook
 
-from tests.utils.utils import get_temp_dir
-
-
-def _strp_cell(cell):
-    val = cell.strip()
-    if val == "":
-        return None
-    val = val.replace(r"\|", "|")
-    return val
+MD_TABLE_CELL_SPLIT = re.compile(r"(?<!\\)\|")
 
 
 def _extract_array(mdtablerow):
-    match = re.match(r"\s*\|(.*)\|\s*", mdtablerow)
-    if match:
-        mtchstr = match.groups()[0]
-        if re.match(r"^[\|-]+$", mtchstr):
-            return False
-        else:
-            return [_strp_cell(c) for c in re.split(r"(?<!\\)\|", mtchstr)]
-
-    return False
+    row = mdtablerow.lstrip()
+    end = row.rfind("|")
+    if not row.startswith("|") or end < 1:
+        return False
+    mtchstr = row[1:end]
+    if mtchstr and not mtchstr.strip("|-"):  # Separator row e.g. |---|---|
+        return False
+    if r"\|" in mtchstr:  # Escaped pipe, so split on unescaped pipes only.
+        cells = (c.replace(r"\|", "|") for c in MD_TABLE_CELL_SPLIT.split(mtchstr))
+    else:
+        cells = mtchstr.split("|")
+    return tuple(c.strip() or None for c in cells)
 
 
 def _is_null_row(r_arr):
-    for cell in r_arr:
-        if cell is not None:
-            return False
+    return all(cell is None for cell in r_arr)
 
-    return True
 
-
-def md_table_to_ss_structure(mdstr: str) -> list[tuple[str, list[list[str]]]]:
-    ss_arr = []
-    for item in mdstr.split("\n"):
-        arr = _extract_array(item)
-        if arr:
-            ss_arr.append(arr)
+def _iter_sheets(mdstr: str) -> Iterator[tuple[str, list[tuple[str, ...]]]]:
     sheet_name = False
     sheet_arr = False
-    sheets = []
-    for row in ss_arr:
+    for line in mdstr.split("\n"):
+        row = _extract_array(line)
+        if not row:
+            continue
         if row[0] is not None:
             if sheet_arr:
-                sheets.append((sheet_name, sheet_arr))
+                yield sheet_name, sheet_arr
             sheet_arr = []
             sheet_name = row[0]
         excluding_first_col = row[1:]
         if sheet_name and not _is_null_row(excluding_first_col):
             sheet_arr.append(excluding_first_col)
-    sheets.append((sheet_name, sheet_arr))
+    yield sheet_name, sheet_arr
+
 
-    return sheets
+def md_table_to_ss_structure(mdstr: str) -> list[tuple[str, list[tuple[str, ...]]]]:
+    return list(_iter_sheets(mdstr=mdstr))
 
 
 def md_table_to_workbook(mdstr: str) -> Workbook:
     """
     Convert Markdown table string to an openpyxl.Workbook. Call wb.save() to persist.
     """
-    md_data = md_table_to_ss_structure(mdstr=mdstr)
     wb = Workbook(write_only=True)
-    for key, rows in md_data:
+    for key, rows in _iter_sheets(mdstr=mdstr):
         sheet = wb.create_sheet(title=key)
         for r in rows:
             sheet.append(r)
     return wb
 
 
-@contextmanager
-def md_table_to_temp_dir(form_id: str, mdstr: str) -> Path:
-    """
-    Convert MarkDown table string to a XLSX file saved in a temp directory.
-
-    :param form_id: The xmlFormId of the Form being referenced.
-    :param mdstr: The MarkDown table string.
-    :return: The path of the XLSX file.
-    """
-    with get_temp_dir() as td:
-        fp = Path(td) / f"{form_id}.xlsx"
-        md_table_to_workbook(mdstr).save(fp.as_posix())
-        yield fp
-
-
 def md_table_to_bytes(mdstr: str) -> bytes:
     """
     Convert MarkDown table string to XLSX Workbook bytes.
@@ -111,9 +84,8 @@ def md_table_to_bytes_xls(mdstr: str) -> bytes:
 
     :param mdstr: The MarkDown table string.
     """
-    md_data = md_table_to_ss_structure(mdstr=mdstr)
     wb = XLSWorkbook()
-    for key, rows in md_data:
+    for key, rows in _iter_sheets(mdstr=mdstr):
         sheet = wb.add_sheet(sheetname=key)
         for ir, row in enumerate(rows):
             for ic, cell in enumerate(row):
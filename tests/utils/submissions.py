@@ -8,7 +8,7 @@ from tests.utils.forms import get_latest_form_version
 
 
 def create_new_or_get_last_submission(
-    client: Client, form_id: str, instance_id: str
+    client: Client, form_id: str, instance_id: str, version: str | None = None
 ) -> str:
     """
     Create a new submission, or get the most recent version, and return it's instance_id.
@@ -16,13 +16,17 @@ def create_new_or_get_last_submission(
     :param client: Client instance to use for API calls.
     :param form_id: The xmlFormId of the Form being referenced.
     :param instance_id: The instanceId of the Submission being referenced.
+    :param version: The form version to submit to. If not provided, the most recently
+      published version is looked up.
     :return: The created instance_id or the instance_id of the most recent version.
     """
+    if version is None:
+        version = get_latest_form_version(client=client, form_id=form_id)
     try:
         old_iid = client.submissions.create(
             xml=submissions_data.get_xml__fruits(
                 form_id=form_id,
-                version=get_latest_form_version(client=client, form_id=form_id),
+                version=version,
                 instance_id=instance_id,
             ),
             form_id=form_id,
@@ -38,9 +42,7 @@ def create_new_or_get_last_submission(
                 iid=instance_id,
             ),
         )
-        old_iid = sorted(
-            (s for s in subvs.json()), key=lambda s: s["createdAt"], reverse=True
-        )[0]["instanceId"]
+        old_iid = max(subvs.json(), key=lambda s: s["createdAt"])["instanceId"]
     return old_iid
 
 
@@ -54,15 +56,17 @@ def create_or_update_submission_with_comment(
     :param form_id: The xmlFormId of the Form being referenced.
     :param instance_id: The instanceId of the Submission being referenced.
     """
+    version = get_latest_form_version(client=client, form_id=form_id)
     pd_iid = create_new_or_get_last_submission(
         client=client,
         form_id=form_id,
         instance_id=instance_id,
+        version=version,
     )
     client.submissions.edit(
         xml=submissions_data.get_xml__fruits(
             form_id=form_id,
-            version=get_latest_form_version(client=client, form_id=form_id),
+            version=version,
             instance_id=uuid4().hex,
             deprecated_instance_id=pd_iid,
         ),
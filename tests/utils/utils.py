@@ -1,4 +1,4 @@
-import shutil
+import os
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
@@ -9,25 +9,19 @@ def get_temp_file(**kwargs) -> Path:
     """
     Create a temporary file.
 
-    :param kwargs: File handling options passed through to NamedTemporaryFile.
+    :param kwargs: File naming options passed through to mkstemp.
     :return: The path of the temporary file.
     """
-    temp_file = tempfile.NamedTemporaryFile(delete=False, **kwargs)
-    temp_file.close()
-    temp_path = Path(temp_file.name)
+    fd, temp_file = tempfile.mkstemp(**kwargs)
+    os.close(fd)
+    temp_path = Path(temp_file)
     try:
         yield temp_path
     finally:
-        temp_file.close()
         temp_path.unlink(missing_ok=True)
 
 
 @contextmanager
 def get_temp_dir() -> Path:
-    temp_dir = tempfile.mkdtemp(prefix="pyodk_tmp_")
-    temp_path = Path(temp_dir)
-    try:
-        yield temp_path
-    finally:
-        if temp_path.exists():
-            shutil.rmtree(temp_dir)
+    with tempfile.TemporaryDirectory(prefix="pyodk_tmp_") as temp_dir:
+        yield Path(temp_dir)